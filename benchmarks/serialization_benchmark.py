@@ -0,0 +1,97 @@
+"""
+Benchmark the `/embed` route for a large embedding payload.
+
+Requests go through the real ApiManager app with `ollama.embed` patched
+to return an `ollama.EmbedResponse`, so the timings include FastAPI's
+conversion, rendering and compression. The `json (baseline)` row is a
+plain FastAPI route returning the model, as `/embed` did before. Reports
+the mean request time and bytes on the wire for each format and content
+coding. Run with `python benchmarks/serialization_benchmark.py`.
+"""
+
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+)
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+import ollama  # noqa: E402
+
+from aimanager import AIManager  # noqa: E402
+from api import ApiManager  # noqa: E402
+import api  # noqa: E402
+import serialization  # noqa: E402
+from serialization import CompressionMiddleware  # noqa: E402
+
+Repeats = 20
+Generator = random.Random(0)
+Result = ollama.EmbedResponse(
+    model="all-minilm",
+    embeddings=[
+        [Generator.uniform(-1.0, 1.0) for _ in range(1024)]
+        for _ in range(64)
+    ],
+)
+
+AIManager.CheckModelStatus = lambda self: None
+api.ollama.embed = lambda model, input: Result
+Manager = ApiManager()
+Manager.ApiKeyCredits[Manager.InitialApiKey] = 10**9
+Client = TestClient(Manager.App)
+
+Baseline = FastAPI()
+Baseline.add_middleware(CompressionMiddleware)
+Baseline.post("/embed")(lambda: Result)
+BaselineClient = TestClient(Baseline)
+
+Routes = {
+    "json (baseline)": (BaselineClient, "json"),
+    "json": (Client, "json"),
+    "msgpack": (Client, "msgpack"),
+    "float32": (Client, "float32"),
+}
+Unavailable = {
+    "json": serialization.orjson is None and "orjson",
+    "msgpack": serialization.msgpack is None and "msgpack",
+}
+Codings = ["identity", "gzip"]
+if serialization.zstandard is not None:
+    Codings.append("zstd")
+
+
+def Request(RouteClient, Format, Coding):
+    """Send one request and return the number of bytes on the wire."""
+    with RouteClient.stream(
+        "POST",
+        "/embed",
+        params={"Model": "all-minilm", "Data": "hello", "Format": Format},
+        headers={"XApiKey": Manager.InitialApiKey,
+                 "Accept-Encoding": Coding},
+    ) as Response:
+        Response.raise_for_status()
+        return int(Response.headers["content-length"])
+
+
+Header = f"{'format':<17}"
+for Coding in Codings:
+    Header += f"{Coding + ' ms':>13}{Coding + ' bytes':>15}"
+print(Header)
+for Name, (RouteClient, Format) in Routes.items():
+    if Unavailable.get(Name):
+        print(f"{Name:<17}skipped: {Unavailable[Name]} is not installed")
+        continue
+    Row = f"{Name:<17}"
+    for Coding in Codings:
+        Size = Request(RouteClient, Format, Coding)
+        Milliseconds = timeit.timeit(
+            lambda: Request(RouteClient, Format, Coding), number=Repeats
+        ) / Repeats * 1000
+        Row += f"{Milliseconds:>13.2f}{Size:>15}"
+    print(Row)
+if "zstd" not in Codings:
+    print("zstd skipped: zstandard is not installed")
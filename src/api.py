@@ -7,6 +7,13 @@ chat sessions, and API key management using FastAPI and Ollama.
 
 from fastapi import FastAPI, HTTPException, Header, Query
 from aimanager import AIManager
+from serialization import (
+    CompressionMiddleware,
+    EmbeddingFormat,
+    FastJSONResponse,
+    Float32Response,
+    MsgPackResponse,
+)
 import ollama
 import subprocess  # nosec B404
 import uvicorn
@@ -27,7 +34,8 @@ class ApiManager:
         self.ApiKeyCredits = {}
         self.DownloadedModels = set()
         self.AiManager = AIManager()
-        self.App = FastAPI()
+        self.App = FastAPI(default_response_class=FastJSONResponse)
+        self.App.add_middleware(CompressionMiddleware)
 
         # Generate initial API key & check if ollama server is running.
         self.InitialApiKey = self.GenerateInitialApiKey()
@@ -201,12 +209,50 @@ class ApiManager:
         self,
         Model: str = Query(...),
         Data: str = Query(...),
+        Format: EmbeddingFormat = Query("json"),
         XApiKey: str = Header(...),
     ):
-        """Embed data into a model."""
+        """
+        Embed data into a model.
+
+        `Format` selects the encoding of the embedding vectors: `json`,
+        `msgpack` or `float32` (raw little-endian matrix).
+        """
+        if Format == "msgpack" and not MsgPackResponse.IsAvailable():
+            raise HTTPException(
+                status_code=501, detail="msgpack is not installed."
+            )
         XApiKey = self.VerifyApiKey(XApiKey)
         self.DecrementCredits(XApiKey)
-        return self.HandleOllamaResponse(ollama.embed, model=Model, data=Data)
+        Result = self.HandleOllamaResponse(
+            ollama.embed, model=Model, input=Data
+        )
+        return self.EncodeEmbeddings(Result, Format)
+
+    def EncodeEmbeddings(self, Result, Format: EmbeddingFormat):
+        """
+        Encode an embedding result in the requested format.
+
+        The response is built directly instead of being returned as a
+        model, which would run FastAPI's slow `jsonable_encoder` over
+        every vector first.
+        """
+        if Format == "float32":
+            Embeddings = Result.get("embeddings")
+            if not isinstance(Embeddings, (list, tuple)):
+                raise HTTPException(
+                    status_code=502, detail="Backend returned no embeddings."
+                )
+            try:
+                return Float32Response(Embeddings)
+            except ValueError as e:
+                raise HTTPException(status_code=502, detail=str(e))
+        Content = (
+            Result.model_dump() if hasattr(Result, "model_dump") else Result
+        )
+        if Format == "msgpack":
+            return MsgPackResponse(Content)
+        return FastJSONResponse(Content)
 
     def Ps(self, XApiKey: str = Header(...)):
         """List running model processes."""
@@ -9,6 +9,7 @@ from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
 from pydantic import BaseModel
 from datetime import datetime, timedelta, timezone
 from jose import JWTError, jwt
+from serialization import CompressionMiddleware, FastJSONResponse
 import uvicorn
 import secrets
 import bcrypt
@@ -78,7 +79,8 @@ class AuthService:
         self.Algorithm = Algorithm
         self.AccessTokenExpireMinutes = AccessTokenExpireMinutes
         self.Oauth2Scheme = OAuth2PasswordBearer(tokenUrl="token")
-        self.App = FastAPI()
+        self.App = FastAPI(default_response_class=FastJSONResponse)
+        self.App.add_middleware(CompressionMiddleware)
         self.TestDb = {
             "test": UserInDB(
                 Username=Username,
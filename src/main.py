@@ -2,6 +2,7 @@
 
 from authservices import AuthService
 from api import ApiManager
+from serialization import CompressionMiddleware, FastJSONResponse
 import uvicorn
 from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
@@ -23,7 +24,8 @@ class MainApp:
         )  # nosec
 
         self.ApiManager = ApiManager()
-        self.App = FastAPI()
+        self.App = FastAPI(default_response_class=FastJSONResponse)
+        self.App.add_middleware(CompressionMiddleware)
 
         # Include authentication and API routes
         self.App.include_router(self.AuthService.App.router)
@@ -0,0 +1,207 @@
+"""
+This file provides response serialization and compression helpers.
+
+Including a fast JSON response class, binary encodings for embedding
+vectors and a negotiated gzip/zstd compression middleware.
+"""
+
+from array import array
+import gzip
+import os
+import sys
+from typing import Any, Literal
+
+import anyio.to_thread
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse, Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+__all__ = [
+    "CompressionMiddleware",
+    "EmbeddingFormat",
+    "FastJSONResponse",
+    "Float32Response",
+    "MsgPackResponse",
+]
+
+EmbeddingFormat = Literal["json", "msgpack", "float32"]
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, falling back to the stdlib."""
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the content to UTF-8 encoded JSON."""
+        if orjson is not None:
+            return orjson.dumps(
+                content,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        return super().render(content)
+
+
+class MsgPackResponse(Response):
+    """MessagePack response, packing floats as single precision."""
+
+    media_type = "application/msgpack"
+
+    @staticmethod
+    def IsAvailable() -> bool:
+        """Return whether the optional msgpack package is installed."""
+        return msgpack is not None
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the content to MessagePack."""
+        if msgpack is None:
+            raise RuntimeError("msgpack is not installed.")
+        return msgpack.packb(content, use_bin_type=True,
+                             use_single_float=True)
+
+
+class Float32Response(Response):
+    """
+    Raw little-endian float32 response for embedding matrices.
+
+    The row and column counts are sent in the `X-Embedding-Shape` header.
+    """
+
+    media_type = "application/octet-stream"
+
+    def __init__(self, content: list, **kwargs):
+        """Initialize the response from a list of embedding vectors."""
+        if not all(isinstance(Row, (list, tuple)) for Row in content):
+            raise ValueError("Embedding vectors must be lists of numbers.")
+        Rows = len(content)
+        Columns = len(content[0]) if Rows else 0
+        if any(len(Row) != Columns for Row in content):
+            raise ValueError("Embedding vectors must share one dimension.")
+        try:
+            super().__init__(content, **kwargs)
+        except TypeError:
+            raise ValueError("Embedding vectors must be numeric.")
+        self.headers["X-Embedding-Shape"] = f"{Rows},{Columns}"
+
+    def render(self, content: list) -> bytes:
+        """Pack the embedding vectors into a contiguous float32 buffer."""
+        Buffer = array("f")
+        for Row in content:
+            Buffer.extend(Row)
+        if sys.byteorder != "little":
+            Buffer.byteswap()
+        return Buffer.tobytes()
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing responses above a size threshold.
+
+    Picks the supported coding (zstd when `zstandard` is installed, gzip)
+    the client rates highest. The threshold defaults to the
+    `COMPRESSION_MINIMUM_SIZE` environment variable. Compression runs in
+    a worker thread so large bodies do not block the event loop.
+    Streamed responses are passed through unchanged.
+    """
+
+    def __init__(self, app, MinimumSize: int | None = None,
+                 CompressLevel: int = 6):
+        """Initialize the middleware with the wrapped ASGI app."""
+        self.App = app
+        self.MinimumSize = (
+            MinimumSize if MinimumSize is not None
+            else int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+        )
+        self.CompressLevel = CompressLevel
+
+    def NegotiateEncoding(self, AcceptEncoding: str):
+        """Return the preferred supported content coding, if any."""
+        Qualities = {}
+        for Part in AcceptEncoding.split(","):
+            Coding, _, Params = Part.partition(";")
+            Name, _, Value = Params.replace(" ", "").partition("=")
+            try:
+                Quality = float(Value) if Name.lower() == "q" else 1.0
+            except ValueError:
+                Quality = 1.0
+            if Coding.strip():
+                Qualities[Coding.strip().lower()] = Quality
+
+        Supported = ["zstd", "gzip"] if zstandard is not None else ["gzip"]
+        Wildcard = Qualities.get("*", 0.0)
+        Best, BestQuality = None, 0.0
+        for Coding in Supported:
+            Quality = Qualities.get(Coding, Wildcard)
+            if Quality > BestQuality:
+                Best, BestQuality = Coding, Quality
+        return Best
+
+    def Compress(self, Body: bytes, Encoding: str) -> bytes:
+        """Compress the body with the negotiated content coding."""
+        if Encoding == "zstd":
+            return zstandard.ZstdCompressor(
+                level=self.CompressLevel
+            ).compress(Body)
+        return gzip.compress(Body, compresslevel=self.CompressLevel,
+                             mtime=0)
+
+    async def __call__(self, scope, receive, send):
+        """Wrap the response and compress it when worthwhile."""
+        if scope["type"] != "http":
+            await self.App(scope, receive, send)
+            return
+
+        Encoding = self.NegotiateEncoding(
+            Headers(scope=scope).get("accept-encoding", "")
+        )
+        if Encoding is None:
+            await self.App(scope, receive, send)
+            return
+
+        StartMessage = None
+        Streaming = False
+
+        async def SendWrapper(Message):
+            nonlocal StartMessage, Streaming
+            if Message["type"] == "http.response.start":
+                StartMessage = Message
+                return
+            if Message["type"] != "http.response.body" or Streaming:
+                await send(Message)
+                return
+
+            Body = Message.get("body", b"")
+            ResponseHeaders = MutableHeaders(raw=StartMessage["headers"])
+            if Message.get("more_body", False):
+                Streaming = True
+                await send(StartMessage)
+                await send(Message)
+                return
+            if (len(Body) < self.MinimumSize
+                    or "content-encoding" in ResponseHeaders):
+                await send(StartMessage)
+                await send(Message)
+                return
+
+            Body = await anyio.to_thread.run_sync(
+                self.Compress, Body, Encoding
+            )
+            ResponseHeaders["Content-Encoding"] = Encoding
+            ResponseHeaders["Content-Length"] = str(len(Body))
+            ResponseHeaders.add_vary_header("Accept-Encoding")
+            await send(StartMessage)
+            await send({"type": "http.response.body", "body": Body})
+
+        await self.App(scope, receive, SendWrapper)
@@ -2,7 +2,16 @@
 Basic tests to ensure the ApiManager class is not empty and can be used.
 """
 
+from array import array
+
+from fastapi.testclient import TestClient
+import ollama
+import pytest
+
+from aimanager import AIManager
 from api import ApiManager
+import api
+import serialization
 
 
 def test_api_manager_instantiation():
@@ -10,3 +19,97 @@ def test_api_manager_instantiation():
     manager = ApiManager()
     assert manager is not None
     assert hasattr(manager, 'App')
+
+
+@pytest.fixture
+def embed_client(monkeypatch):
+    """Provide an ApiManager client with a patched ollama.embed."""
+    monkeypatch.setattr(AIManager, "CheckModelStatus", lambda self: None)
+    calls = []
+    result = ollama.EmbedResponse(
+        model="m", embeddings=[[0.5, 1.0], [2.0, 4.0]]
+    )
+
+    def fake_embed(model, input):
+        calls.append((model, input))
+        return result
+
+    monkeypatch.setattr(api.ollama, "embed", fake_embed)
+    manager = ApiManager()
+    return TestClient(manager.App), manager, calls, result
+
+
+def embed(client, manager, format):
+    """Request embeddings for a fixed input in the given format."""
+    return client.post(
+        "/embed",
+        params={"Model": "m", "Data": "hello", "Format": format},
+        headers={"XApiKey": manager.InitialApiKey},
+    )
+
+
+def test_embed_json(embed_client):
+    """Test that embeddings are requested with `input` and returned as JSON."""
+    client, manager, calls, result = embed_client
+    response = embed(client, manager, "json")
+    assert response.status_code == 200
+    assert response.json() == result.model_dump()
+    assert calls == [("m", "hello")]
+    assert manager.ApiKeyCredits[manager.InitialApiKey] == 4
+
+
+def test_embed_msgpack(embed_client):
+    """Test that embeddings can be returned as MessagePack."""
+    msgpack = pytest.importorskip("msgpack")
+    client, manager, _, result = embed_client
+    response = embed(client, manager, "msgpack")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content) == result.model_dump()
+
+
+def test_embed_float32(embed_client):
+    """Test that embeddings can be returned as a raw float32 matrix."""
+    client, manager, _, result = embed_client
+    response = embed(client, manager, "float32")
+    assert response.status_code == 200
+    assert response.headers["x-embedding-shape"] == "2,2"
+    assert array("f", response.content).tolist() == [0.5, 1.0, 2.0, 4.0]
+
+
+def test_embed_unsupported_format(embed_client):
+    """Test that unknown formats are rejected without charging credits."""
+    client, manager, calls, _ = embed_client
+    response = embed(client, manager, "xml")
+    assert response.status_code == 422
+    assert calls == []
+    assert manager.ApiKeyCredits[manager.InitialApiKey] == 5
+
+
+def test_embed_msgpack_missing(embed_client, monkeypatch):
+    """Test that a missing msgpack package fails before charging credits."""
+    client, manager, calls, _ = embed_client
+    monkeypatch.setattr(serialization, "msgpack", None)
+    response = embed(client, manager, "msgpack")
+    assert response.status_code == 501
+    assert calls == []
+    assert manager.ApiKeyCredits[manager.InitialApiKey] == 5
+
+
+@pytest.mark.parametrize("embeddings", [
+    [[0.5, 1.0], [2.0]],
+    [[0.5, "a"]],
+    [0.5, 1.0],
+    None,
+])
+def test_embed_float32_invalid_backend_result(
+    embed_client, monkeypatch, embeddings
+):
+    """Test that ragged, flat, non-numeric or missing embeddings give 502."""
+    client, manager, _, _ = embed_client
+    result = ollama.EmbedResponse.model_construct(
+        model="m", embeddings=embeddings
+    )
+    monkeypatch.setattr(api.ollama, "embed", lambda model, input: result)
+    response = embed(client, manager, "float32")
+    assert response.status_code == 502
@@ -0,0 +1,131 @@
+"""
+Basic tests to ensure the serialization helpers encode and compress.
+"""
+
+from array import array
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+import pytest
+
+import serialization
+from serialization import (
+    CompressionMiddleware,
+    FastJSONResponse,
+    Float32Response,
+    MsgPackResponse,
+)
+
+LARGE_BODY = b"x" * 2048
+
+
+def make_client():
+    """Build a small app returning large, small, streamed and encoded data."""
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.add_middleware(CompressionMiddleware, MinimumSize=512)
+    app.get("/large")(lambda: {"embeddings": [[0.5] * 512]})
+    app.get("/small")(lambda: {"message": "ok"})
+    app.get("/stream")(lambda: StreamingResponse(
+        iter([LARGE_BODY, LARGE_BODY]), media_type="text/plain"
+    ))
+    app.get("/encoded")(lambda: Response(
+        gzip.compress(LARGE_BODY), headers={"Content-Encoding": "gzip"}
+    ))
+    return TestClient(app)
+
+
+def test_fast_json_response_renders_json():
+    """Test that FastJSONResponse produces compact JSON bytes."""
+    response = FastJSONResponse({"a": [1, 2.5]})
+    assert response.body == b'{"a":[1,2.5]}'
+
+
+def test_msgpack_response_round_trip():
+    """Test that MsgPackResponse output unpacks to the original content."""
+    msgpack = pytest.importorskip("msgpack")
+    content = {"model": "m", "embeddings": [[0.5, -1.0], [2.0, 0.25]]}
+    response = MsgPackResponse(content)
+    assert response.media_type == "application/msgpack"
+    assert msgpack.unpackb(response.body) == content
+
+
+def test_float32_response_packs_matrix():
+    """Test that Float32Response packs vectors and reports the shape."""
+    response = Float32Response([[1.0, 2.0], [3.0, 4.0]])
+    assert response.headers["X-Embedding-Shape"] == "2,2"
+    assert array("f", response.body).tolist() == [1.0, 2.0, 3.0, 4.0]
+
+
+def test_float32_response_rejects_invalid_vectors():
+    """Test that flat, ragged or non-numeric vectors raise ValueError."""
+    with pytest.raises(ValueError):
+        Float32Response([1.0, 2.0])
+    with pytest.raises(ValueError):
+        Float32Response([[1.0, 2.0], [3.0]])
+    with pytest.raises(ValueError):
+        Float32Response([[1.0, "a"]])
+
+
+def test_compression_above_threshold():
+    """Test that only payloads above the threshold are gzip encoded."""
+    client = make_client()
+    large = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert large.headers["content-encoding"] == "gzip"
+    assert large.json() == {"embeddings": [[0.5] * 512]}
+    assert "content-encoding" not in small.headers
+
+
+def test_compression_zstd():
+    """Test that zstd is used when accepted and installed."""
+    zstandard = pytest.importorskip("zstandard")
+    client = make_client()
+    response = client.get("/large", headers={"Accept-Encoding": "zstd"})
+    assert response.headers["content-encoding"] == "zstd"
+    assert response.json() == {"embeddings": [[0.5] * 512]}
+    compressed = CompressionMiddleware(None).Compress(LARGE_BODY, "zstd")
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(
+        compressed
+    ) == LARGE_BODY
+
+
+def test_compression_skips_streamed_and_encoded_responses():
+    """Test that streamed and already encoded bodies are not recompressed."""
+    client = make_client()
+    streamed = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    encoded = client.get("/encoded", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in streamed.headers
+    assert streamed.content == LARGE_BODY * 2
+    assert encoded.headers["content-encoding"] == "gzip"
+    assert encoded.content == LARGE_BODY
+
+
+def test_compression_minimum_size_from_environment(monkeypatch):
+    """Test that the threshold defaults to COMPRESSION_MINIMUM_SIZE."""
+    monkeypatch.setenv("COMPRESSION_MINIMUM_SIZE", "64")
+    assert CompressionMiddleware(None).MinimumSize == 64
+    assert CompressionMiddleware(None, MinimumSize=8).MinimumSize == 8
+
+
+def test_compression_negotiation(monkeypatch):
+    """Test that codings are chosen by quality and refusals are honored."""
+    middleware = CompressionMiddleware(None)
+    assert middleware.NegotiateEncoding("gzip;q=0") is None
+    assert middleware.NegotiateEncoding("identity") is None
+    assert middleware.NegotiateEncoding("br, gzip;q=0.5") == "gzip"
+    assert gzip.decompress(middleware.Compress(b"x", "gzip")) == b"x"
+
+    monkeypatch.setattr(serialization, "zstandard", None)
+    assert middleware.NegotiateEncoding("gzip;q=0, *") is None
+    assert middleware.NegotiateEncoding("*") == "gzip"
+
+
+def test_compression_negotiation_prefers_highest_quality():
+    """Test that the client's quality ordering wins over server order."""
+    pytest.importorskip("zstandard")
+    middleware = CompressionMiddleware(None)
+    assert middleware.NegotiateEncoding("zstd;q=0.1, gzip") == "gzip"
+    assert middleware.NegotiateEncoding("gzip;q=0, *") == "zstd"
+    assert middleware.NegotiateEncoding("gzip, zstd") == "zstd"
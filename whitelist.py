@@ -3,7 +3,9 @@
 # flake8: noqa
 
 _.ManageAI  # unused method (src\aimanager.py:90)
-_.DownloadedModels  # unused attribute (src\api.py:28)
-_.Oauth2Scheme  # unused attribute (src\authservices.py:80)
-_.OAuth2Scheme  # unused attribute (src\main.py:31)
-SecureChat  # unused function (src\main.py:56)
+_.DownloadedModels  # unused attribute (src\api.py:35)
+_.Oauth2Scheme  # unused attribute (src\authservices.py:81)
+_.OAuth2Scheme  # unused attribute (src\main.py:34)
+SecureChat  # unused function (src\main.py:59)
+media_type  # unused variable (src\serialization.py:60)
+media_type  # unused variable (src\serialization.py:82)